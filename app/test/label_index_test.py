@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add root to import the model and label index
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from model import Issue
+from label_index import LabelIndex
+
+# 11 issues so that the bitmaps need padding bits
+LABELS = [
+    ['kind/bug', 'area/installer'],
+    ['kind/bug'],
+    [],
+    ['kind/feature', 'area/installer'],
+    ['kind/feature'],
+    ['kind/bug', 'area/installer', 'kind/feature'],
+    [],
+    ['area/docs'],
+    ['kind/bug'],
+    [],
+    ['area/installer'],
+]
+
+
+class TestLabelIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.issues = [Issue({'state': 'open', 'number': i, 'labels': labels}) for i, labels in enumerate(LABELS)]
+        self.index = LabelIndex(self.issues)
+
+    def expected(self, predicate):
+        return [i for i, labels in enumerate(LABELS) if predicate(set(labels))]
+
+    def test_match_single_label(self):
+        self.assertEqual(list(self.index.indices(self.index.match('kind/bug'))),
+                         self.expected(lambda l: 'kind/bug' in l))
+
+    def test_match_and(self):
+        self.assertEqual(list(self.index.indices(self.index.match('kind/bug+area/installer'))),
+                         self.expected(lambda l: {'kind/bug', 'area/installer'} <= l))
+
+    def test_match_or(self):
+        self.assertEqual(list(self.index.indices(self.index.match('area/docs, kind/feature'))),
+                         self.expected(lambda l: 'area/docs' in l or 'kind/feature' in l))
+
+    def test_match_and_or(self):
+        self.assertEqual(list(self.index.indices(self.index.match('kind/bug+area/installer,area/docs'))),
+                         self.expected(lambda l: {'kind/bug', 'area/installer'} <= l or 'area/docs' in l))
+
+    def test_match_unknown_label(self):
+        self.assertEqual(self.index.count(self.index.match('unknown')), 0)
+        self.assertEqual(self.index.count(self.index.match('kind/bug+unknown')), 0)
+        self.assertEqual(list(self.index.indices(self.index.match('unknown,area/docs'))), [7])
+
+    def test_count_ignores_padding(self):
+        self.assertEqual(self.index.count(~self.index.empty()), len(LABELS))
+        self.assertEqual(self.index.count(self.index.all_of([])), len(LABELS))
+
+    def test_intersection_with_result_set(self):
+        bitmap = self.index.bitmap_of([0, 3, 8, 10]) & self.index.bitmap('area/installer')
+        self.assertEqual([issue.number for issue in self.index.to_issues(bitmap)], [0, 3, 10])
+
+    def test_label_counts(self):
+        self.assertEqual(self.index.label_counts(),
+                         {'kind/bug': 4, 'area/installer': 4, 'kind/feature': 3, 'area/docs': 1})
+        self.assertEqual(self.index.label_counts(~self.index.bitmap_of([0, 1, 2, 3, 4, 5])),
+                         {'area/docs': 1, 'kind/bug': 1, 'area/installer': 1})
+
+    def test_co_occurrence(self):
+        labels, matrix = self.index.co_occurrence()
+        self.assertEqual(matrix.shape, (len(labels), len(labels)))
+        for i, a in enumerate(labels):
+            for j, b in enumerate(labels):
+                self.assertEqual(matrix[i, j], len(self.expected(lambda l: a in l and b in l)))
+        self.assertTrue(np.array_equal(matrix, matrix.T))
+
+    def test_co_occurrence_within_bitmap(self):
+        labels, matrix = self.index.co_occurrence(~self.index.bitmap_of([0]))
+        bug, installer = labels.index('kind/bug'), labels.index('area/installer')
+        self.assertEqual(matrix[bug, installer], 1)
+        self.assertEqual(matrix[bug, bug], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
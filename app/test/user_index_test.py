@@ -0,0 +1,108 @@
+import unittest
+from collections import defaultdict
+from datetime import datetime
+import sys
+import os
+
+# Add root to import the model and user index
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from model import Issue
+from user_index import UserIndex
+
+ISSUES_JSON = [
+    {
+        'creator': 'alice', 'state': 'open', 'assignees': ['bob', 'frank'],
+        'created_date': '2024-05-01T10:00:00Z',
+        'events': [
+            {'event_type': 'commented', 'author': 'bob', 'event_date': '2024-05-02T11:00:00Z'},
+            {'event_type': 'labeled', 'author': 'carol', 'event_date': '2024-05-03T12:00:00Z'},
+            {'event_type': 'closed', 'author': 'alice', 'event_date': '2024-05-04T13:00:00Z'},
+        ],
+    },
+    {
+        'creator': 'bob', 'state': 'closed',
+        'created_date': '2024-06-01T10:00:00Z',
+        'events': [
+            {'event_type': 'commented', 'author': 'alice', 'event_date': '2024-06-02T11:00:00Z'},
+            {'event_type': 'subscribed', 'author': 'dave', 'event_date': '2024-06-02T12:00:00Z'},
+            {'event_type': 'reopened', 'author': 'bob'},
+            {'event_type': 'commented'},
+        ],
+    },
+    {
+        'creator': None, 'state': 'open', 'assignees': ['bob', 'alice'],
+        'created_date': '2024-07-01T10:00:00Z',
+        'events': [
+            {'event_type': 'commented', 'author': 'bob', 'event_date': '2024-07-02T11:00:00Z'},
+        ],
+    },
+    {
+        'creator': 'erin', 'state': 'open',
+        'created_date': '2024-08-01T10:00:00Z',
+        'events': [
+            {'event_type': 'commented', 'author': 'dave', 'event_date': '2024-08-02T11:00:00Z'},
+            {'event_type': 'commented', 'author': 'frank', 'event_date': '2024-08-02T12:00:00Z'},
+        ],
+    },
+]
+
+
+def old_top_contributor_counts(issues, countable_events):
+    """
+    Aggregation as previously done by feature 3 on the raw JSON.
+    """
+    contributions = defaultdict(int)
+    for issue in issues:
+        creator = issue.get("creator")
+        if creator:
+            contributions[creator] += 1
+        for event in issue.get("events", []):
+            author = event.get("author")
+            event_type = event.get("event_type")
+            if event_type in countable_events and author:
+                contributions[author] += 1
+    return dict(contributions)
+
+
+class TestUserIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = UserIndex([Issue(i) for i in ISSUES_JSON])
+
+    def test_event_count(self):
+        self.assertEqual(self.index.event_count('bob'), 3)
+        self.assertEqual(self.index.event_count('bob', {'commented'}), 2)
+        self.assertEqual(self.index.event_count('unknown'), 0)
+
+    def test_created_and_assigned_issues(self):
+        self.assertEqual([i.creator for i in self.index.created_issues('bob')], ['bob'])
+        self.assertEqual(len(self.index.assigned_issues('bob')), 2)
+        self.assertEqual(len(self.index.assigned_issues('alice')), 1)
+
+    def test_issue_events(self):
+        pairs = list(self.index.issue_events('alice'))
+        self.assertEqual(sorted((issue.creator, event.event_type) for issue, event in pairs),
+                         [('alice', 'closed'), ('bob', 'commented')])
+
+    def test_issues_touched(self):
+        self.assertEqual([i.creator for i in self.index.issues_touched('alice')], ['alice', 'bob'])
+        # Naive datetimes are treated as UTC
+        touched = self.index.issues_touched('bob', start=datetime(2024, 5, 3))
+        self.assertEqual([i.created_date.month for i in touched], [6, 7])
+        touched = self.index.issues_touched('bob', start=datetime(2024, 5, 1), end=datetime(2024, 6, 30))
+        self.assertEqual([i.created_date.month for i in touched], [5, 6])
+        # Assignments alone do not count as touching an issue
+        self.assertEqual(self.index.issues_touched('carol', start=datetime(2024, 7, 1)), [])
+
+    def test_contributions_match_old_feature_3(self):
+        countable_events = {"commented", "closed", "labeled", "reopened"}
+        contributions = self.index.contributions(countable_events)
+        expected = old_top_contributor_counts(ISSUES_JSON, countable_events)
+        # Same users in the same first-seen order, so ties in the top N are broken the same way
+        self.assertEqual(list(contributions.items()), list(expected.items()))
+        top_n = lambda counts: sorted(counts.items(), key=lambda x: x[1], reverse=True)[:4]
+        self.assertEqual(top_n(contributions), top_n(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
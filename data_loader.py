@@ -4,9 +4,15 @@ from typing import List
 
 import config
 from model import Issue
+from user_index import UserIndex
+from label_index import LabelIndex
 
 # Store issues as singleton to avoid reloads
 _ISSUES:List[Issue] = None
+# Per-user index over _ISSUES, built together with the issues
+_USER_INDEX:UserIndex = None
+# Label bitmap index over _ISSUES, built together with the issues
+_LABEL_INDEX:LabelIndex = None
 
 class DataLoader:
     """
@@ -24,12 +30,30 @@ class DataLoader:
         This should be invoked by other parts of the application to get access
         to the issues in the data file.
         """
-        global _ISSUES # to access it within the function
+        global _ISSUES, _USER_INDEX, _LABEL_INDEX # to access it within the function
         if _ISSUES is None:
             _ISSUES = self._load()
+            _USER_INDEX = UserIndex(_ISSUES)
+            _LABEL_INDEX = LabelIndex(_ISSUES)
             print(f'Loaded {len(_ISSUES)} issues from {self.data_path}.')
         return _ISSUES
     
+    def get_user_index(self):
+        """
+        Returns the per-user index over the issues so that analyses
+        focusing on a specific user do not need to scan all issues.
+        """
+        self.get_issues()
+        return _USER_INDEX
+    
+    def get_label_index(self):
+        """
+        Returns the label bitmap index over the issues so that label
+        filters can be evaluated as bitwise operations.
+        """
+        self.get_issues()
+        return _LABEL_INDEX
+    
     def _load(self):
         """
         Loads the issues into memory.
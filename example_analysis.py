@@ -32,15 +32,16 @@ class ExampleAnalysis:
         
         ### BASIC STATISTICS
         # Calculate the total number of events for a specific user (if specified in command line args)
-        total_events:int = 0
-        for issue in issues:
-            total_events += len([e for e in issue.events if self.USER is None or e.author == self.USER])
-        
-        output:str = f'Found {total_events} events across {len(issues)} issues'
         if self.USER is not None:
-            output += f' for {self.USER}.'
+            # Use the per-user index rather than scanning every event
+            user_index = DataLoader().get_user_index()
+            total_events:int = user_index.event_count(self.USER)
+            output:str = (f'Found {total_events} events across {len(issues)} issues'
+                          f' for {self.USER}, who created {len(user_index.created_issues(self.USER))} issues'
+                          f' and is assigned to {len(user_index.assigned_issues(self.USER))} issues.')
         else:
-            output += '.'
+            total_events:int = sum(len(issue.events) for issue in issues)
+            output:str = f'Found {total_events} events across {len(issues)} issues.'
         print('\n\n'+output+'\n\n')
         
 
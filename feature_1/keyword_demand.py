@@ -3,6 +3,7 @@ from typing import List
 import matplotlib.pyplot as plt
 from collections import Counter
 from model import Issue
+import config
 
 class KeywordDemand():
     def __init__(self, keyword:str):
@@ -10,6 +11,8 @@ class KeywordDemand():
         Constructor that initializes the keyword to search for
         """
         self.keyword = keyword.lower() # Stored in lowercase
+        # Parameter is passed in via command line (--label)
+        self.label:str = config.get_parameter('label')
 
     def run(self):
         """
@@ -20,22 +23,32 @@ class KeywordDemand():
 
         # Getting the issues
         issues: List[Issue] = DataLoader().get_issues()
-        self.matched = []
+        label_index = DataLoader().get_label_index()
+        matched_indices = []
 
-        for issue in issues:
+        for i, issue in enumerate(issues):
             title = (issue.title or "").lower()
             body = (issue.text or "").lower()
 
             if self.keyword in title or self.keyword in body:
-                self.matched.append(issue)
+                matched_indices.append(i)
 
-        self.analyze_and_plot(self.matched)
+        # Intersect the keyword matches with the label filter as a bitwise operation
+        self.matched_bitmap = label_index.bitmap_of(matched_indices)
+        if self.label:
+            self.matched_bitmap = self.matched_bitmap & label_index.match(self.label)
+        self.matched = label_index.to_issues(self.matched_bitmap)
 
-    def analyze_and_plot(self,matched:List):
+        self.analyze_and_plot(self.matched_bitmap)
+
+    def analyze_and_plot(self,matched_bitmap):
         """
         Here, the labels, comments and the timelines in which the keywords appeared will be counted and plotted
         """
-        label_counts = Counter()
+        label_index = DataLoader().get_label_index()
+        matched: List[Issue] = label_index.to_issues(matched_bitmap)
+        # Count labels of the matched issues with the label bitmaps
+        label_counts = Counter(label_index.label_counts(matched_bitmap))
         monthly_counts = Counter()
         total_comments = 0
 
@@ -44,16 +57,15 @@ class KeywordDemand():
             comment_count = len([e for e in issue.events if e.event_type == 'commented'])
             total_comments += comment_count
 
-            # Count labels
-            for label in issue.labels:
-                label_counts[label] += 1
-
             # Count issues per month
             if issue.created_date:
                 month = issue.created_date.strftime("%Y-%m")
                 monthly_counts[month] += 1
 
-        print(f" Found {len(matched)} issues mentioning '{self.keyword}'")
+        label_text = f" with label '{self.label}'" if self.label else ""
+        print(f" Found {len(matched)} issues mentioning '{self.keyword}'{label_text}")
+        if not matched:
+            return
         print(f"Avg. comments per issue: {total_comments / len(matched):.2f}")
 
         # Plot label bar chart
@@ -16,6 +16,8 @@ class TimestampActivityAnalysis:
         # Get date parameters from config
         self.start_date: Optional[datetime] = None
         self.end_date: Optional[datetime] = None
+        # Optional user (--user) to limit the heatmaps to that user's activity
+        self.user: Optional[str] = config.get_parameter('user')
         
         if start_date_str := config.get_parameter('start_date'):
             self.start_date = datetime.strptime(start_date_str, '%Y-%m-%d').replace(
@@ -64,6 +66,23 @@ class TimestampActivityAnalysis:
             counts[hour] += 1
         return [counts[h] for h in range(24)]
 
+    def is_issue_in_range(self, issue: Issue) -> bool:
+        """Check if issue was either created or updated in the filter range"""
+        # Default to True if no filters
+        if not self.start_date and not self.end_date:
+            return True
+        return (
+            self.is_within_date_range(issue.created_date) or
+            self.is_within_date_range(issue.updated_date)
+        )
+
+    def collect_event_hour(self, event: Event, event_hours: List[int], stats: dict):
+        """Collect the hour of an event if it is within the filter range"""
+        if event.event_date:
+            if (not self.start_date and not self.end_date) or self.is_within_date_range(event.event_date):
+                event_hours.append(event.event_date.hour)
+                stats['filtered_events'] += 1
+
     def run(self):
         issues = DataLoader().get_issues()
         issue_hours, event_hours = [], []
@@ -74,28 +93,24 @@ class TimestampActivityAnalysis:
             'filtered_events': 0
         }
 
+        user_index = None
+        if self.user:
+            # Only look at the issues created by the user and the user's own events via the user index
+            user_index = DataLoader().get_user_index()
+            issues = user_index.created_issues(self.user)
+            stats['touched_issues'] = len(user_index.issues_touched(self.user, self.start_date, self.end_date))
+
         for issue in issues:
             # Check if issue should be included (either created or updated in range)
-            issue_in_range = True  # Default to True if no filters
-            
-            # Only apply filters if at least one date is specified
-            if self.start_date or self.end_date:
-                issue_in_range = (
-                    self.is_within_date_range(issue.created_date) or 
-                    self.is_within_date_range(issue.updated_date)
-                )
-            
-            if not issue_in_range:
+            if not self.is_issue_in_range(issue):
                 continue
                 
             stats['filtered_issues'] += 1
             
             # Filter and count events (only if date filters exist)
-            for event in issue.events:
-                if event.event_date:
-                    if (not self.start_date and not self.end_date) or self.is_within_date_range(event.event_date):
-                        event_hours.append(event.event_date.hour)
-                        stats['filtered_events'] += 1
+            if user_index is None:
+                for event in issue.events:
+                    self.collect_event_hour(event, event_hours, stats)
             
             # Include issue timestamps
             if issue.created_date:
@@ -103,6 +118,12 @@ class TimestampActivityAnalysis:
             if issue.updated_date:
                 issue_hours.append(issue.updated_date.hour)
 
+        if user_index is not None:
+            # Apply the same rule as above: only events of issues in range are counted
+            for issue, event in user_index.issue_events(self.user):
+                if self.is_issue_in_range(issue):
+                    self.collect_event_hour(event, event_hours, stats)
+
         # Generate heatmap data
         issue_counts = self.count_hours(issue_hours)
         event_counts = self.count_hours(event_hours)
@@ -118,6 +139,9 @@ class TimestampActivityAnalysis:
             date_text.append(f"End: {self.end_date.strftime('%Y-%m-%d')}")
         
         # Add date range as text above heatmaps
+        if self.user:
+            date_text.append(f"User: {self.user} ({self.format_heatmap_number(stats['touched_issues'])} issues touched)")
+        
         if date_text:
             fig.text(0.5, 0.95, " | ".join(date_text), 
                     ha='center', 
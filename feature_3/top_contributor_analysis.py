@@ -1,42 +1,22 @@
-import json
-from collections import defaultdict
 import matplotlib.pyplot as plt
 import sys
 import os
 
-# Add root to import config
+# Add root to import data loader
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import config
+from data_loader import DataLoader
 
 class TopContributorAnalysis:
-    def __init__(self):
-        self.data_path = config.get_parameter("DATA_FILE")
-
-    def load_data(self):
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
     def run(self):
-        issues = self.load_data()
+        issues = DataLoader().get_issues()
         if not issues:
             print("No issues found in dataset.")
             return {}
 
-        contributions = defaultdict(int)
-
         countable_events = {"commented", "closed", "labeled", "reopened"}
 
-        for issue in issues:
-            creator = issue.get("creator")
-            if creator:
-                contributions[creator] += 1
-
-            for event in issue.get("events", []):
-                if isinstance(event, dict):
-                    author = event.get("author")
-                    event_type = event.get("event_type")
-                    if event_type in countable_events and author:
-                        contributions[author] += 1
+        # Aggregate per author from the user index instead of re-reading the data file
+        contributions = DataLoader().get_user_index().contributions(countable_events)
 
         if not contributions:
             print("No contributor activity found.")
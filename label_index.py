@@ -0,0 +1,139 @@
+"""
+Implements a label index over the loaded issues. Every label is interned
+to an integer id and has one bitmap (a packed NumPy bit array) with one
+bit per issue. Label filters and intersections with other result sets
+(e.g., keyword or date matches) then become bitwise operations.
+"""
+
+from typing import List, Dict, Iterable, Tuple
+import numpy as np
+
+from model import Issue
+
+
+class LabelIndex:
+    """
+    Maps each label to a bitmap of the issues that carry it. Bit i of a
+    bitmap refers to position i in the list of issues the index was built from.
+    """
+
+    def __init__(self, issues:List[Issue]):
+        self.issues:List[Issue] = issues
+        self.labels:List[str] = []
+        self._label_ids:Dict[str, int] = {}
+        self._bitmaps:np.ndarray = None
+        # Bitmap of all issues, its padding bits are zero
+        self._all:np.ndarray = np.packbits(np.ones(len(issues), dtype=bool))
+        self._build()
+
+    def _build(self):
+        """
+        Interns all labels and sets the bit of every issue in its labels' bitmaps.
+        """
+        rows, cols = [], []
+        for issue_idx, issue in enumerate(self.issues):
+            for label in issue.labels:
+                if label not in self._label_ids:
+                    self._label_ids[label] = len(self.labels)
+                    self.labels.append(label)
+                rows.append(self._label_ids[label])
+                cols.append(issue_idx)
+        bits = np.zeros((len(self.labels), len(self.issues)), dtype=bool)
+        bits[rows, cols] = True
+        self._bitmaps = np.packbits(bits, axis=1)
+
+    def empty(self) -> np.ndarray:
+        """
+        Bitmap without any issues.
+        """
+        return np.zeros((len(self.issues) + 7) // 8, dtype=np.uint8)
+
+    def bitmap(self, label:str) -> np.ndarray:
+        """
+        Bitmap of the issues with the given label. Unknown labels match no issues.
+        """
+        if label not in self._label_ids:
+            return self.empty()
+        return self._bitmaps[self._label_ids[label]]
+
+    def all_of(self, labels:Iterable[str]) -> np.ndarray:
+        """
+        Bitmap of the issues that have all the given labels.
+        """
+        result = self._all
+        for label in labels:
+            result = result & self.bitmap(label)
+        return result
+
+    def any_of(self, labels:Iterable[str]) -> np.ndarray:
+        """
+        Bitmap of the issues that have at least one of the given labels.
+        """
+        result = self.empty()
+        for label in labels:
+            result = result | self.bitmap(label)
+        return result
+
+    def match(self, expression:str) -> np.ndarray:
+        """
+        Bitmap of the issues matching a label expression as passed via --label.
+        A ',' separates alternatives (OR) and a '+' combines labels (AND),
+        e.g. 'kind/bug+area/installer,kind/feature'.
+        """
+        result = self.empty()
+        for term in expression.split(','):
+            labels = [label.strip() for label in term.split('+') if label.strip()]
+            if labels:
+                result = result | self.all_of(labels)
+        return result
+
+    def bitmap_of(self, issue_indices:Iterable[int]) -> np.ndarray:
+        """
+        Bitmap of the given issue positions, e.g. the result of a keyword
+        or date filter, so that it can be combined with label bitmaps.
+        """
+        bits = np.zeros(len(self.issues), dtype=bool)
+        bits[np.fromiter(issue_indices, dtype=np.int64)] = True
+        return np.packbits(bits)
+
+    def indices(self, bitmap:np.ndarray) -> np.ndarray:
+        """
+        Issue positions whose bits are set in the bitmap.
+        """
+        return np.flatnonzero(np.unpackbits(bitmap, count=len(self.issues)))
+
+    def to_issues(self, bitmap:np.ndarray) -> List[Issue]:
+        """
+        Issues whose bits are set in the bitmap.
+        """
+        return [self.issues[i] for i in self.indices(bitmap)]
+
+    def count(self, bitmap:np.ndarray) -> int:
+        """
+        Number of issues in the bitmap.
+        """
+        # Count set bits on the packed bytes, masking out padding bits
+        # that a complement (~) of the bitmap may have set
+        return int(np.bitwise_count(bitmap & self._all).sum())
+
+    def label_counts(self, bitmap:np.ndarray = None) -> Dict[str, int]:
+        """
+        Number of issues per label, optionally only counting the issues in the bitmap.
+        """
+        # Count set bits on the packed bytes, the padding bits of the label bitmaps are always zero
+        bitmaps = self._bitmaps if bitmap is None else self._bitmaps & bitmap
+        counts = np.bitwise_count(bitmaps).sum(axis=1)
+        return {label: int(counts[i]) for i, label in enumerate(self.labels) if counts[i] > 0}
+
+    def co_occurrence(self, bitmap:np.ndarray = None) -> Tuple[List[str], np.ndarray]:
+        """
+        Label co-occurrence matrix in a single vectorised pass. Entry (i, j)
+        is the number of issues carrying both labels[i] and labels[j], the
+        diagonal holds the number of issues per label. Optionally only the
+        issues in the bitmap are considered.
+        """
+        bitmaps = self._bitmaps if bitmap is None else self._bitmaps & bitmap
+        # NumPy only hands float matmuls to BLAS, integer ones are far slower.
+        # float32 counts are exact up to 2^24 issues.
+        bits = np.unpackbits(bitmaps, axis=1, count=len(self.issues)).astype(np.float32)
+        return self.labels, np.rint(bits @ bits.T).astype(np.int64)
@@ -38,7 +38,8 @@ def parse_args():
     
     # Optional parameter for analyses focusing on a specific label
     ap.add_argument('--label', '-l', type=str, required=False,
-                    help='Optional parameter for analyses focusing on a specific label')
+                    help='Optional parameter for analyses focusing on a specific label. '
+                         'Combine labels with "+" (all of) and "," (any of)')
     ap.add_argument('--keyword',type=str, required=False,
                     help='Put the parameter you want facts about')
     
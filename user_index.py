@@ -0,0 +1,173 @@
+"""
+Implements a per-user index over the loaded issues so that analyses
+focusing on a single user (e.g., via the --user flag) only need to look
+at that user's activity instead of scanning every event of every issue.
+"""
+
+from typing import List, Dict, Tuple, Iterator
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from model import Issue, Event
+
+# Position of an event in the data set: (index of issue, index of event in issue.events)
+EventPosition = Tuple[int, int]
+
+
+def _as_utc(dt:datetime) -> datetime:
+    """
+    Treats naive datetimes as UTC so they can be compared with the parsed issue dates.
+    """
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+class UserActivity:
+    """
+    Activity of a single user: the issues they created, the issues
+    they are assigned to and the positions of their events by type.
+    """
+
+    def __init__(self):
+        self.created_issues:List[int] = []
+        self.assigned_issues:List[int] = []
+        self.events_by_type:Dict[str, List[EventPosition]] = defaultdict(list)
+
+    def event_count(self, event_types:set = None) -> int:
+        """
+        Number of events by this user, optionally only of the given types.
+        """
+        if event_types is None:
+            return sum(len(positions) for positions in self.events_by_type.values())
+        return sum(len(self.events_by_type.get(t, [])) for t in event_types)
+
+
+class UserIndex:
+    """
+    Maps each user to their activity. The index is built once
+    from the list of issues and refers back into that list by position.
+    """
+
+    def __init__(self, issues:List[Issue]):
+        self.issues:List[Issue] = issues
+        self._users:Dict[str, UserActivity] = defaultdict(UserActivity)
+        self._build()
+
+    def _build(self):
+        """
+        Walks all issues and events once to populate the index.
+        """
+        for issue_idx, issue in enumerate(self.issues):
+            if issue.creator:
+                self._users[issue.creator].created_issues.append(issue_idx)
+            for assignee in issue.assignees:
+                if assignee:
+                    self._users[assignee].assigned_issues.append(issue_idx)
+            for event_idx, event in enumerate(issue.events):
+                if event.author:
+                    self._users[event.author].events_by_type[event.event_type].append((issue_idx, event_idx))
+
+    def users(self) -> List[str]:
+        """
+        All users that appear in the index.
+        """
+        return list(self._users.keys())
+
+    def get(self, user:str) -> UserActivity:
+        """
+        Activity of the given user. Returns an empty activity if the user is unknown.
+        """
+        if user in self._users:
+            return self._users[user]
+        return UserActivity()
+
+    def created_issues(self, user:str) -> List[Issue]:
+        """
+        Issues created by the given user.
+        """
+        return [self.issues[i] for i in self.get(user).created_issues]
+
+    def assigned_issues(self, user:str) -> List[Issue]:
+        """
+        Issues the given user is assigned to.
+        """
+        return [self.issues[i] for i in self.get(user).assigned_issues]
+
+    def issue_events(self, user:str, event_types:set = None) -> Iterator[Tuple[Issue, Event]]:
+        """
+        Iterates over the events authored by the given user together with
+        the issue they belong to, optionally only those of the given types.
+        """
+        activity = self.get(user)
+        for event_type, positions in activity.events_by_type.items():
+            if event_types is not None and event_type not in event_types:
+                continue
+            for issue_idx, event_idx in positions:
+                issue = self.issues[issue_idx]
+                yield issue, issue.events[event_idx]
+
+    def events(self, user:str, event_types:set = None) -> Iterator[Event]:
+        """
+        Iterates over the events authored by the given user, optionally
+        only those of the given types.
+        """
+        for _, event in self.issue_events(user, event_types):
+            yield event
+
+    def event_count(self, user:str, event_types:set = None) -> int:
+        """
+        Number of events authored by the given user.
+        """
+        return self.get(user).event_count(event_types)
+
+    def issues_touched(self, user:str, start:datetime = None, end:datetime = None) -> List[Issue]:
+        """
+        Issues the user created or authored an event on, optionally limited
+        to activity that falls between start and end (inclusive). Naive
+        datetimes are treated as UTC. Being assigned to an issue does not
+        count as touching it since the assignment has no date of the user's own.
+        """
+        start, end = _as_utc(start), _as_utc(end)
+
+        def in_range(dt:datetime) -> bool:
+            dt = _as_utc(dt)
+            if dt is None:
+                return start is None and end is None
+            if start is not None and dt < start:
+                return False
+            if end is not None and dt > end:
+                return False
+            return True
+
+        activity = self.get(user)
+        touched = set()
+        for issue_idx in activity.created_issues:
+            if in_range(self.issues[issue_idx].created_date):
+                touched.add(issue_idx)
+        for positions in activity.events_by_type.values():
+            for issue_idx, event_idx in positions:
+                if issue_idx not in touched and in_range(self.issues[issue_idx].events[event_idx].event_date):
+                    touched.add(issue_idx)
+        return [self.issues[i] for i in sorted(touched)]
+
+    def contributions(self, event_types:set = None) -> Dict[str, int]:
+        """
+        Number of issues created plus number of events (optionally of the
+        given types) for every user with at least one such contribution.
+        Users are ordered by their first contribution in the data set, as
+        if the issues and their events were walked in order.
+        """
+        first_seen = {}
+        for user, activity in self._users.items():
+            # A created issue comes before the events of that issue
+            positions = [(issue_idx, -1) for issue_idx in activity.created_issues[:1]]
+            for event_type, event_positions in activity.events_by_type.items():
+                if event_positions and (event_types is None or event_type in event_types):
+                    positions.append(event_positions[0])
+            if positions:
+                first_seen[user] = min(positions)
+        return {
+            user: len(self._users[user].created_issues) + self._users[user].event_count(event_types)
+            for user in sorted(first_seen, key=first_seen.get)
+        }